@@ -8,11 +8,45 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import json
+import multiprocessing
+import re
 import sys
-from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; fall back to stdlib csv
+    pa = None
+    pacsv = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+# Writers buffer this many SKUs' worth of output between f.write calls;
+# bulk joined writes are far cheaper than one write per line.
+WRITE_BATCH_SKUS = 1000
+
+# Byte-oriented writers flush once this much output has accumulated,
+# keeping write syscalls large and few (matters on slow filesystems)
+FLUSH_BYTES = 1 << 20
+
+LONG_CSV_COLUMNS = [
+    "sku",
+    "product_name",
+    "product_url",
+    "category",
+    "family",
+    "spec_group",
+    "spec_name",
+    "spec_value",
+]
+
 
 def configure_console_utf8() -> None:
     try:
@@ -21,11 +55,43 @@ def configure_console_utf8() -> None:
         pass
 
 
+def read_long_columns(input_path: Path, columns: list[str]) -> list[list[str]]:
+    """Read the requested columns from the long-format CSV as Python lists.
+
+    Uses pyarrow's C parser when available (5-20x faster on a multi-MB CSV,
+    and repeated strings are shared in the Arrow string arrays); falls back
+    to the stdlib csv module otherwise.
+    """
+    if pacsv is not None:
+        # Memory-map the file so pyarrow parses straight out of the OS page
+        # cache without user-space buffer copies
+        with pa.memory_map(str(input_path), "r") as source:
+            tbl = pacsv.read_csv(
+                source,
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=columns,
+                    column_types={c: pa.string() for c in columns},
+                ),
+            )
+        return [tbl.column(c).to_pylist() for c in columns]
+
+    # Positional csv.reader skips DictReader's per-row dict build
+    out: list[list[str]] = [[] for _ in columns]
+    with input_path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        targets = [(lst.append, header.index(col)) for lst, col in zip(out, columns)]
+        for row in reader:
+            for append, i in targets:
+                append(row[i])
+    return out
+
+
 def load_long_csv(input_path: Path) -> dict[str, dict]:
     """Load long-format CSV and organize by SKU."""
-    
+
     sku_data: dict[str, dict] = {}
-    
+
     # Define the order of spec groups
     group_order = [
         "Essentials",
@@ -38,219 +104,406 @@ def load_long_csv(input_path: Path) -> dict[str, dict]:
         "Advanced Technologies",
         "Security & Reliability",
     ]
-    
-    with input_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            sku = row["sku"]
-            spec_group = row["spec_group"]
-            spec_name = row["spec_name"]
-            spec_value = row["spec_value"]
-            
-            if sku not in sku_data:
-                sku_data[sku] = {
+
+    # O(1) group -> rank lookup; unknown groups sort last
+    group_rank = {group: i for i, group in enumerate(group_order)}
+    unknown_rank = len(group_order)
+
+    skus, product_names, product_urls, categories, families, spec_groups, spec_names, spec_values = (
+        read_long_columns(input_path, LONG_CSV_COLUMNS)
+    )
+
+    # The scraper writes all of a SKU's rows consecutively (and a group's
+    # rows consecutively within the SKU), so cache the active entry across
+    # iterations instead of re-resolving three dict lookups per row.
+    last_sku = last_group = None
+    specs: dict | None = None
+    group_specs: dict | None = None
+
+    for sku, product_name, product_url, category, family, spec_group, spec_name, spec_value in zip(
+        skus, product_names, product_urls, categories, families, spec_groups, spec_names, spec_values
+    ):
+        if sku != last_sku:
+            entry = sku_data.get(sku)
+            if entry is None:
+                entry = sku_data[sku] = {
                     "sku": sku,
-                    "product_name": row["product_name"],
-                    "product_url": row["product_url"],
-                    "category": row["category"],
-                    "family": row["family"],
-                    "specs": OrderedDict(),
+                    "product_name": product_name,
+                    "product_url": product_url,
+                    # Categories and families repeat across most SKUs
+                    "category": sys.intern(category),
+                    "family": sys.intern(family),
+                    "specs": {},
                 }
-            
-            # Organize specs by group
-            if spec_group not in sku_data[sku]["specs"]:
-                sku_data[sku]["specs"][spec_group] = OrderedDict()
-            
-            sku_data[sku]["specs"][spec_group][spec_name] = spec_value
-    
-    # Sort specs by group order
-    for sku in sku_data:
-        sorted_specs = OrderedDict()
-        for group in group_order:
-            if group in sku_data[sku]["specs"]:
-                sorted_specs[group] = sku_data[sku]["specs"][group]
-        # Add any remaining groups not in the predefined order
-        for group in sku_data[sku]["specs"]:
-            if group not in sorted_specs:
-                sorted_specs[group] = sku_data[sku]["specs"][group]
-        sku_data[sku]["specs"] = sorted_specs
+            specs = entry["specs"]
+            last_sku = sku
+            last_group = None
+
+        # Organize specs by group
+        if spec_group != last_group:
+            spec_group = sys.intern(spec_group)
+            group_specs = specs.get(spec_group)
+            if group_specs is None:
+                group_specs = specs[spec_group] = {}
+            last_group = spec_group
+
+        # Spec names repeat across every SKU, and short values ("Yes",
+        # socket names, ...) are highly repetitive; interning collapses
+        # them to shared objects. Long values are left alone.
+        group_specs[sys.intern(spec_name)] = (
+            sys.intern(spec_value) if len(spec_value) < 32 else spec_value
+        )
     
+    # Sort specs by group order (stable, so unknown groups keep insertion order)
+    for data in sku_data.values():
+        data["specs"] = dict(
+            sorted(data["specs"].items(), key=lambda kv: group_rank.get(kv[0], unknown_rank))
+        )
+
     return sku_data
 
 
+# Strips trademark symbols and collapses runs of spaces in one C-level pass
+_CLEAN_RE = re.compile(r"[®™]| {2,}")
+
+
+@functools.lru_cache(maxsize=None)
 def extract_model_name(product_name: str) -> str:
     """Extract the processor model name from full product name."""
     # e.g., "Intel® Core™ i7-11850HE Processor (24M Cache, up to 4.70 GHz)"
     # -> "i7-11850HE" or "Intel Core i7-11850HE"
-    
-    # Try to find processor number in specs, fallback to parsing product name
-    name = product_name.replace("®", "").replace("™", "").replace("  ", " ")
-    
+
+    name = _CLEAN_RE.sub(lambda m: "" if m.group() in ("®", "™") else " ", product_name)
+
     # Remove common suffixes
     for suffix in ["Processor", "processor"]:
-        if suffix in name:
-            name = name.split(suffix)[0].strip()
-    
+        head, sep, _ = name.partition(suffix)
+        if sep:
+            name = head.strip()
+
     return name.strip()
 
 
-def write_markdown(sku_data: dict[str, dict], output_path: Path) -> None:
+MARKDOWN_HEADER = (
+    "# Intel Processor Specifications Database\n\n"
+    "This document contains detailed specifications for Intel processors.\n"
+    "Search by processor model name (e.g., 'i7-11850HE', 'Xeon Gold 5118').\n\n"
+    "---\n\n"
+)
+
+TEXT_HEADER = "INTEL PROCESSOR SPECIFICATIONS DATABASE\n" + "=" * 50 + "\n\n"
+
+
+# Rendered spec-group blocks, keyed by the group's exact contents. Products
+# in the same family often share identical groups (e.g. the same "Advanced
+# Technologies" block), so rendering each distinct block once pays off.
+_markdown_group_cache: dict[tuple, str] = {}
+_text_group_cache: dict[tuple, str] = {}
+
+
+def render_markdown_group(group: str, specs: dict[str, str]) -> str:
+    key = (group, tuple(specs.items()))
+    block = _markdown_group_cache.get(key)
+    if block is None:
+        block = _markdown_group_cache[key] = (
+            f"### {group}\n\n"
+            + "".join(f"- **{name}:** {value}\n" for name, value in specs.items())
+            + "\n"
+        )
+    return block
+
+
+def render_text_group(group: str, specs: dict[str, str]) -> str:
+    key = (group, tuple(specs.items()))
+    block = _text_group_cache.get(key)
+    if block is None:
+        block = _text_group_cache[key] = (
+            f"[{group}]\n"
+            + "".join(f"  {name}: {value}\n" for name, value in specs.items())
+            + "\n"
+        )
+    return block
+
+
+def render_markdown_sku(data: dict, model_name: str) -> str:
+    """Render one product's markdown section."""
+    parts = [
+        f"## {model_name}\n\n",
+        f"**Full Name:** {data['product_name']}\n",
+        f"**SKU:** {data['sku']}\n",
+        f"**Category:** {data['category']}\n",
+        f"**Family:** {data['family']}\n",
+        f"**URL:** {data['product_url']}\n\n",
+    ]
+
+    for group, specs in data["specs"].items():
+        parts.append(render_markdown_group(group, specs))
+
+    parts.append("---\n\n")
+    return "".join(parts)
+
+
+def write_markdown(ordered: list[tuple[str, dict]], model_names: dict[str, str], output_path: Path) -> None:
     """Write LLM-friendly markdown format."""
-    
+
     with output_path.open("w", encoding="utf-8") as f:
-        f.write("# Intel Processor Specifications Database\n\n")
-        f.write("This document contains detailed specifications for Intel processors.\n")
-        f.write("Search by processor model name (e.g., 'i7-11850HE', 'Xeon Gold 5118').\n\n")
-        f.write("---\n\n")
-        
-        # Sort by product name for easier searching
-        sorted_skus = sorted(sku_data.keys(), key=lambda s: sku_data[s]["product_name"])
-        
-        for sku in sorted_skus:
-            data = sku_data[sku]
-            model_name = extract_model_name(data["product_name"])
-            
-            f.write(f"## {model_name}\n\n")
-            f.write(f"**Full Name:** {data['product_name']}\n")
-            f.write(f"**SKU:** {data['sku']}\n")
-            f.write(f"**Category:** {data['category']}\n")
-            f.write(f"**Family:** {data['family']}\n")
-            f.write(f"**URL:** {data['product_url']}\n\n")
-            
-            for group, specs in data["specs"].items():
-                f.write(f"### {group}\n\n")
-                for spec_name, spec_value in specs.items():
-                    f.write(f"- **{spec_name}:** {spec_value}\n")
-                f.write("\n")
-            
-            f.write("---\n\n")
-    
+        parts: list[str] = [MARKDOWN_HEADER]
+
+        for i, (sku, data) in enumerate(ordered, start=1):
+            parts.append(render_markdown_sku(data, model_names[sku]))
+
+            # Flush periodically to bound peak memory
+            if i % WRITE_BATCH_SKUS == 0:
+                f.write("".join(parts))
+                parts.clear()
+
+        f.write("".join(parts))
+
     print(f"Written markdown: {output_path}")
 
 
-def write_jsonl(sku_data: dict[str, dict], output_path: Path) -> None:
+def open_jsonl(output_path: Path):
+    """Open the JSONL output, returning (file, joiner, dumps_line).
+
+    orjson serializes straight to UTF-8 bytes, so the file is opened in
+    binary mode when it is available.
+    """
+    if orjson is not None:
+        return output_path.open("wb"), b"", lambda record: orjson.dumps(record) + b"\n"
+    return (
+        output_path.open("w", encoding="utf-8"),
+        "",
+        lambda record: json.dumps(record, ensure_ascii=False) + "\n",
+    )
+
+
+def augment_records(ordered: list[tuple[str, dict]], model_names: dict[str, str]) -> None:
+    """Precompute per-product structures shared by the JSON-family writers.
+
+    In "all" mode the flattened specs and searchable text block would
+    otherwise be rebuilt independently by write_jsonl and write_json.
+    """
+    for sku, data in ordered:
+        # Flatten specs for easier querying
+        flat_specs = {}
+        for group, specs in data["specs"].items():
+            for spec_name, spec_value in specs.items():
+                flat_specs[f"{group}: {spec_name}"] = spec_value
+        data["_flat_specs"] = flat_specs
+        data["_text_block"] = generate_text_block(data, model_names[sku])
+
+
+def build_jsonl_record(data: dict, model_name: str) -> dict:
+    """Build one product's JSONL record."""
+    return {
+        "model": model_name,
+        "full_name": data["product_name"],
+        "sku": data["sku"],
+        "category": data["category"],
+        "family": data["family"],
+        "url": data["product_url"],
+        "specs": data["_flat_specs"],
+        # Searchable text block
+        "text": data["_text_block"],
+    }
+
+
+def write_jsonl(ordered: list[tuple[str, dict]], model_names: dict[str, str], output_path: Path) -> None:
     """Write JSONL format (one JSON object per line) - ideal for embeddings."""
-    
-    with output_path.open("w", encoding="utf-8") as f:
-        sorted_skus = sorted(sku_data.keys(), key=lambda s: sku_data[s]["product_name"])
-        
-        for sku in sorted_skus:
-            data = sku_data[sku]
-            model_name = extract_model_name(data["product_name"])
-            
-            # Flatten specs for easier querying
-            flat_specs = {}
-            for group, specs in data["specs"].items():
-                for spec_name, spec_value in specs.items():
-                    flat_specs[f"{group}: {spec_name}"] = spec_value
-            
-            record = {
-                "model": model_name,
-                "full_name": data["product_name"],
-                "sku": data["sku"],
-                "category": data["category"],
-                "family": data["family"],
-                "url": data["product_url"],
-                "specs": flat_specs,
-                # Add searchable text block
-                "text": generate_text_block(data, model_name),
-            }
-            
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-    
+
+    if orjson is not None:
+        # Accumulate encoded records in a bytearray and flush in ~1 MiB
+        # chunks; buffering is disabled since we batch the writes ourselves
+        with output_path.open("wb", buffering=0) as f:
+            buf = bytearray()
+            for sku, data in ordered:
+                buf += orjson.dumps(build_jsonl_record(data, model_names[sku]))
+                buf += b"\n"
+                if len(buf) >= FLUSH_BYTES:
+                    f.write(buf)
+                    buf.clear()
+            if buf:
+                f.write(buf)
+    else:
+        with output_path.open("w", encoding="utf-8") as f:
+            lines = []
+            for i, (sku, data) in enumerate(ordered, start=1):
+                lines.append(json.dumps(build_jsonl_record(data, model_names[sku]), ensure_ascii=False) + "\n")
+
+                # Flush periodically to bound peak memory
+                if i % WRITE_BATCH_SKUS == 0:
+                    f.write("".join(lines))
+                    lines.clear()
+
+            f.write("".join(lines))
+
     print(f"Written JSONL: {output_path}")
 
 
 def generate_text_block(data: dict, model_name: str) -> str:
     """Generate a searchable text block for a product."""
-    lines = [
-        f"Processor: {model_name}",
-        f"Full Name: {data['product_name']}",
-        f"Category: {data['category']}",
-        f"Family: {data['family']}",
-        "",
+    header = (
+        f"Processor: {model_name}\n"
+        f"Full Name: {data['product_name']}\n"
+        f"Category: {data['category']}\n"
+        f"Family: {data['family']}\n\n"
+    )
+
+    # Joined comprehensions build the string at C level instead of growing
+    # a Python list one append at a time
+    groups = "\n\n".join(
+        f"{group}:\n" + "\n".join(f"  {name}: {value}" for name, value in specs.items())
+        for group, specs in data["specs"].items()
+    )
+
+    return header + groups + "\n"
+
+
+def render_text_sku(data: dict, model_name: str) -> str:
+    """Render one product's plain-text section."""
+    parts = [
+        f"{'='*60}\n",
+        f"PROCESSOR: {model_name}\n",
+        f"{'='*60}\n\n",
+        f"Full Name: {data['product_name']}\n",
+        f"SKU: {data['sku']}\n",
+        f"Category: {data['category']}\n",
+        f"Family: {data['family']}\n",
+        f"URL: {data['product_url']}\n\n",
     ]
-    
     for group, specs in data["specs"].items():
-        lines.append(f"{group}:")
-        for spec_name, spec_value in specs.items():
-            lines.append(f"  {spec_name}: {spec_value}")
-        lines.append("")
-    
-    return "\n".join(lines)
+        parts.append(render_text_group(group, specs))
+
+    parts.append("\n")
+    return "".join(parts)
 
 
-def write_text(sku_data: dict[str, dict], output_path: Path) -> None:
+def write_text(ordered: list[tuple[str, dict]], model_names: dict[str, str], output_path: Path) -> None:
     """Write plain text format optimized for semantic search."""
-    
+
     with output_path.open("w", encoding="utf-8") as f:
-        f.write("INTEL PROCESSOR SPECIFICATIONS DATABASE\n")
-        f.write("=" * 50 + "\n\n")
-        
-        sorted_skus = sorted(sku_data.keys(), key=lambda s: sku_data[s]["product_name"])
-        
-        for sku in sorted_skus:
-            data = sku_data[sku]
-            model_name = extract_model_name(data["product_name"])
-            
-            f.write(f"{'='*60}\n")
-            f.write(f"PROCESSOR: {model_name}\n")
-            f.write(f"{'='*60}\n\n")
-            
-            f.write(f"Full Name: {data['product_name']}\n")
-            f.write(f"SKU: {data['sku']}\n")
-            f.write(f"Category: {data['category']}\n")
-            f.write(f"Family: {data['family']}\n")
-            f.write(f"URL: {data['product_url']}\n\n")
-            
-            for group, specs in data["specs"].items():
-                f.write(f"[{group}]\n")
-                for spec_name, spec_value in specs.items():
-                    f.write(f"  {spec_name}: {spec_value}\n")
-                f.write("\n")
-            
-            f.write("\n")
-    
+        parts: list[str] = [TEXT_HEADER]
+
+        for i, (sku, data) in enumerate(ordered, start=1):
+            parts.append(render_text_sku(data, model_names[sku]))
+
+            # Flush periodically to bound peak memory
+            if i % WRITE_BATCH_SKUS == 0:
+                f.write("".join(parts))
+                parts.clear()
+
+        f.write("".join(parts))
+
     print(f"Written text: {output_path}")
 
 
-def write_json(sku_data: dict[str, dict], output_path: Path) -> None:
+def add_json_record(by_model: dict[str, dict], sku: str, data: dict, model_name: str) -> None:
+    """Add one product to the model-name-keyed JSON index."""
+    record = {
+        "model": model_name,
+        "full_name": data["product_name"],
+        "sku": data["sku"],
+        "category": data["category"],
+        "family": data["family"],
+        "url": data["product_url"],
+        # Serialization only reads the spec dicts, so no defensive copy
+        "specs": data["specs"],
+    }
+
+    # Use model name as key (handle duplicates by appending SKU)
+    key = model_name
+    if key in by_model:
+        key = f"{model_name} (SKU {sku})"
+    by_model[key] = record
+
+
+def dump_json(by_model: dict[str, dict], output_path: Path) -> None:
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(by_model, option=orjson.OPT_INDENT_2))
+    else:
+        with output_path.open("w", encoding="utf-8") as f:
+            json.dump(by_model, f, ensure_ascii=False, indent=2)
+
+
+def write_json(ordered: list[tuple[str, dict]], model_names: dict[str, str], output_path: Path) -> None:
     """Write a single JSON file with all data, keyed by model name."""
-    
+
     # Build lookup by model name
     by_model: dict[str, dict] = {}
-    
-    for sku, data in sku_data.items():
-        model_name = extract_model_name(data["product_name"])
-        
-        # Convert OrderedDict to regular dict for JSON
-        specs_dict = {}
-        for group, specs in data["specs"].items():
-            specs_dict[group] = dict(specs)
-        
-        record = {
-            "model": model_name,
-            "full_name": data["product_name"],
-            "sku": data["sku"],
-            "category": data["category"],
-            "family": data["family"],
-            "url": data["product_url"],
-            "specs": specs_dict,
-        }
-        
-        # Use model name as key (handle duplicates by appending SKU)
-        key = model_name
-        if key in by_model:
-            key = f"{model_name} (SKU {sku})"
-        by_model[key] = record
-    
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(by_model, f, ensure_ascii=False, indent=2)
-    
+
+    for sku, data in ordered:
+        add_json_record(by_model, sku, data, model_names[sku])
+
+    dump_json(by_model, output_path)
+
     print(f"Written JSON: {output_path}")
 
 
+def write_all(ordered: list[tuple[str, dict]], model_names: dict[str, str], output_base: Path) -> None:
+    """Write every output format in a single pass over the products.
+
+    Iterating once and emitting each SKU's fragment to all four outputs
+    avoids walking the spec dicts four times in "all" mode.
+    """
+    jf, joiner, dumps_line = open_jsonl(output_base.with_suffix(".jsonl"))
+    by_model: dict[str, dict] = {}
+
+    with output_base.with_suffix(".md").open("w", encoding="utf-8") as mf, \
+            output_base.with_suffix(".txt").open("w", encoding="utf-8") as tf, \
+            jf:
+        md_parts: list[str] = [MARKDOWN_HEADER]
+        txt_parts: list[str] = [TEXT_HEADER]
+        jsonl_lines = []
+
+        for i, (sku, data) in enumerate(ordered, start=1):
+            model_name = model_names[sku]
+
+            md_parts.append(render_markdown_sku(data, model_name))
+            txt_parts.append(render_text_sku(data, model_name))
+            jsonl_lines.append(dumps_line(build_jsonl_record(data, model_name)))
+            add_json_record(by_model, sku, data, model_name)
+
+            # Flush periodically to bound peak memory
+            if i % WRITE_BATCH_SKUS == 0:
+                mf.write("".join(md_parts))
+                tf.write("".join(txt_parts))
+                jf.write(joiner.join(jsonl_lines))
+                md_parts.clear()
+                txt_parts.clear()
+                jsonl_lines.clear()
+
+        mf.write("".join(md_parts))
+        tf.write("".join(txt_parts))
+        jf.write(joiner.join(jsonl_lines))
+
+    print(f"Written markdown: {output_base.with_suffix('.md')}")
+    print(f"Written JSONL: {output_base.with_suffix('.jsonl')}")
+    print(f"Written text: {output_base.with_suffix('.txt')}")
+
+    # JSON needs a single root object, so it is dumped after the pass
+    dump_json(by_model, output_base.with_suffix(".json"))
+    print(f"Written JSON: {output_base.with_suffix('.json')}")
+
+
+# Populated before forking the "all"-mode writer pool. Submit arguments
+# are always pickled through the call queue even under fork, so the
+# dataset is published as a module global instead: forked workers inherit
+# it copy-on-write and each task only ships a writer name and a path.
+_fork_shared: dict = {}
+
+_WRITERS_BY_NAME = {
+    "markdown": write_markdown,
+    "jsonl": write_jsonl,
+    "text": write_text,
+    "json": write_json,
+}
+
+
+def _write_format(writer_name: str, output_path: str) -> None:
+    writer = _WRITERS_BY_NAME[writer_name]
+    writer(_fork_shared["ordered"], _fork_shared["model_names"], Path(output_path))
+
+
 def main() -> None:
     configure_console_utf8()
     
@@ -286,20 +539,53 @@ def main() -> None:
     print(f"Loading {input_path}...")
     sku_data = load_long_csv(input_path)
     print(f"Loaded {len(sku_data)} products")
-    
+
+    # Sort by product name once (for easier searching) and cache model names,
+    # instead of re-sorting and re-extracting in every writer.
+    ordered = sorted(sku_data.items(), key=lambda kv: kv[1]["product_name"])
+    model_names = {sku: extract_model_name(data["product_name"]) for sku, data in ordered}
+
     fmt = args.format.lower()
-    
-    if fmt in ("markdown", "md", "all"):
-        write_markdown(sku_data, output_base.with_suffix(".md"))
-    
+
+    # Only the jsonl writer reads the augmented fields; plain json works
+    # straight off data["specs"]
     if fmt in ("jsonl", "all"):
-        write_jsonl(sku_data, output_base.with_suffix(".jsonl"))
-    
-    if fmt in ("text", "txt", "all"):
-        write_text(sku_data, output_base.with_suffix(".txt"))
-    
-    if fmt in ("json", "all"):
-        write_json(sku_data, output_base.with_suffix(".json"))
+        augment_records(ordered, model_names)
+
+    if fmt == "all":
+        if "fork" in multiprocessing.get_all_start_methods():
+            # The four writers are independent and CPU-bound. The dataset is
+            # published as a module global *before* the pool forks, so each
+            # worker reads it from its inherited address space; only the
+            # writer name and output path cross the call queue.
+            _fork_shared["ordered"] = ordered
+            _fork_shared["model_names"] = model_names
+            ctx = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=4, mp_context=ctx) as executor:
+                futures = [
+                    executor.submit(_write_format, "markdown", str(output_base.with_suffix(".md"))),
+                    executor.submit(_write_format, "jsonl", str(output_base.with_suffix(".jsonl"))),
+                    executor.submit(_write_format, "text", str(output_base.with_suffix(".txt"))),
+                    executor.submit(_write_format, "json", str(output_base.with_suffix(".json"))),
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            # No fork (e.g. Windows): shipping the data to workers would cost
+            # more than it saves, so do one fused pass over the products
+            write_all(ordered, model_names, output_base)
+    else:
+        if fmt in ("markdown", "md"):
+            write_markdown(ordered, model_names, output_base.with_suffix(".md"))
+
+        if fmt == "jsonl":
+            write_jsonl(ordered, model_names, output_base.with_suffix(".jsonl"))
+
+        if fmt in ("text", "txt"):
+            write_text(ordered, model_names, output_base.with_suffix(".txt"))
+
+        if fmt == "json":
+            write_json(ordered, model_names, output_base.with_suffix(".json"))
     
     print("\nDone!")
 
@@ -9,9 +9,88 @@ from __future__ import annotations
 import argparse
 import csv
 import sys
-from collections import OrderedDict
+from itertools import chain, groupby
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; fall back to stdlib csv
+    pa = None
+    pacsv = None
+    pq = None
+
+LONG_CSV_COLUMNS = [
+    "sku",
+    "product_name",
+    "product_url",
+    "category",
+    "family",
+    "spec_group",
+    "spec_name",
+    "spec_value",
+    "scraped_at",
+]
+
+# Order of spec groups for column organization
+GROUP_ORDER = [
+    "Essentials",
+    "CPU Specifications",
+    "Supplemental Information",
+    "Memory Specifications",
+    "GPU Specifications",
+    "Expansion Options",
+    "Package Specifications",
+    "Advanced Technologies",
+    "Security & Reliability",
+]
+
+# O(1) group -> rank lookup; unknown groups sort last
+GROUP_RANK = {group: i for i, group in enumerate(GROUP_ORDER)}
+UNKNOWN_GROUP_RANK = len(GROUP_ORDER)
+
+META_COLS = ["sku", "product_name", "product_url", "category", "family", "scraped_at"]
+
+
+def column_sort_key(col: str) -> tuple[int, str]:
+    """Sort spec columns by group order, then alphabetically within a group."""
+    group = col.split(":")[0]
+    return (GROUP_RANK.get(group, UNKNOWN_GROUP_RANK), col)
+
+
+def read_long_columns(input_path: Path, columns: list[str]) -> list[list[str]]:
+    """Read the requested columns from the long-format CSV as Python lists.
+
+    Uses pyarrow's C parser when available (5-20x faster on a multi-MB CSV,
+    and repeated strings are shared in the Arrow string arrays); falls back
+    to the stdlib csv module otherwise.
+    """
+    if pacsv is not None:
+        # Memory-map the file so pyarrow parses straight out of the OS page
+        # cache without user-space buffer copies
+        with pa.memory_map(str(input_path), "r") as source:
+            tbl = pacsv.read_csv(
+                source,
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=columns,
+                    column_types={c: pa.string() for c in columns},
+                ),
+            )
+        return [tbl.column(c).to_pylist() for c in columns]
+
+    # Positional csv.reader skips DictReader's per-row dict build
+    out: list[list[str]] = [[] for _ in columns]
+    with input_path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        targets = [(lst.append, header.index(col)) for lst, col in zip(out, columns)]
+        for row in reader:
+            for append, i in targets:
+                append(row[i])
+    return out
+
 
 def configure_console_utf8() -> None:
     try:
@@ -20,101 +99,159 @@ def configure_console_utf8() -> None:
         pass
 
 
-def convert_long_to_wide(input_path: Path, output_path: Path) -> None:
-    """Convert long-format CSV to wide-format CSV."""
+def convert_long_to_wide(input_path: Path, output_path: Path, parquet: bool = False) -> None:
+    """Convert long-format CSV to wide format (CSV, or Parquet with parquet=True)."""
     
     # First pass: collect all unique spec columns and SKU data
     sku_data: dict[str, dict[str, str]] = {}
-    spec_columns: OrderedDict[str, None] = OrderedDict()  # Preserve order
-    
-    # Define the order of spec groups for column organization
-    group_order = [
-        "Essentials",
-        "CPU Specifications",
-        "Supplemental Information", 
-        "Memory Specifications",
-        "GPU Specifications",
-        "Expansion Options",
-        "Package Specifications",
-        "Advanced Technologies",
-        "Security & Reliability",
-    ]
-    
+    spec_columns: dict[str, None] = {}  # Preserve insertion order
+
     print(f"Reading {input_path}...")
-    
-    with input_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            sku = row["sku"]
-            spec_group = row["spec_group"]
-            spec_name = row["spec_name"]
-            spec_value = row["spec_value"]
-            
-            # Create column name: "Group: Spec Name"
-            col_name = f"{spec_group}: {spec_name}"
-            spec_columns[col_name] = None
-            
-            # Initialize SKU entry if not exists
-            if sku not in sku_data:
-                sku_data[sku] = {
-                    "sku": sku,
-                    "product_name": row["product_name"],
-                    "product_url": row["product_url"],
-                    "category": row["category"],
-                    "family": row["family"],
-                    "scraped_at": row["scraped_at"],
-                }
-            
-            # Store the spec value
-            sku_data[sku][col_name] = spec_value
+
+    skus, product_names, product_urls, categories, families, spec_groups, spec_names, spec_values, scraped_ats = (
+        read_long_columns(input_path, LONG_CSV_COLUMNS)
+    )
+
+    for sku, product_name, product_url, category, family, spec_group, spec_name, spec_value, scraped_at in zip(
+        skus, product_names, product_urls, categories, families, spec_groups, spec_names, spec_values, scraped_ats
+    ):
+        # Create column name: "Group: Spec Name"; interned because the same
+        # column recurs for nearly every SKU and keys a dict per row
+        col_name = sys.intern(f"{spec_group}: {spec_name}")
+        spec_columns[col_name] = None
+
+        # Initialize SKU entry if not exists (single probe on the hit path)
+        entry = sku_data.get(sku)
+        if entry is None:
+            entry = sku_data[sku] = {
+                "sku": sku,
+                "product_name": product_name,
+                "product_url": product_url,
+                # Categories and families repeat across most SKUs
+                "category": sys.intern(category),
+                "family": sys.intern(family),
+                "scraped_at": scraped_at,
+            }
+
+        # Store the spec value; short values ("Yes", socket names, ...) are
+        # highly repetitive, long ones are left alone
+        entry[col_name] = sys.intern(spec_value) if len(spec_value) < 32 else spec_value
     
     print(f"Found {len(sku_data)} unique SKUs")
     print(f"Found {len(spec_columns)} unique spec columns")
     
-    # Sort spec columns by group order, then alphabetically within each group
-    def column_sort_key(col: str) -> tuple[int, str]:
-        group = col.split(":")[0]
-        try:
-            group_idx = group_order.index(group)
-        except ValueError:
-            group_idx = len(group_order)  # Unknown groups go last
-        return (group_idx, col)
-    
     sorted_spec_cols = sorted(spec_columns.keys(), key=column_sort_key)
-    
+
     # Build final column order
-    meta_cols = ["sku", "product_name", "product_url", "category", "family", "scraped_at"]
-    all_columns = meta_cols + sorted_spec_cols
+    all_columns = META_COLS + sorted_spec_cols
     
     print(f"Writing {output_path}...")
-    
-    with output_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=all_columns, extrasaction="ignore")
-        writer.writeheader()
-        
-        # Sort SKUs for consistent output
-        for sku in sorted(sku_data.keys()):
-            row_data = sku_data[sku]
-            # Fill missing columns with empty string
-            for col in sorted_spec_cols:
-                if col not in row_data:
-                    row_data[col] = ""
-            writer.writerow(row_data)
-    
+
+    # Sort SKUs for consistent output
+    sorted_skus = sorted(sku_data.keys())
+
+    if parquet and pa is None:
+        print("Error: Parquet output requires pyarrow (pip install pyarrow)")
+        sys.exit(1)
+
+    if pa is not None:
+        # Columnar build: one contiguous list per column, missing cells stay
+        # empty; pyarrow then encodes the output in C.
+        cols = {col: [""] * len(sorted_skus) for col in all_columns}
+        for i, sku in enumerate(sorted_skus):
+            for col, value in sku_data[sku].items():
+                cols[col][i] = value
+        tbl = pa.table({col: pa.array(values, type=pa.string()) for col, values in cols.items()})
+        if parquet:
+            # Compressed columnar output: much smaller on disk and no CSV
+            # quoting/escaping cost for downstream analytics users
+            pq.write_table(tbl, output_path, compression="zstd")
+        else:
+            pacsv.write_csv(tbl, output_path, write_options=pacsv.WriteOptions(include_header=True))
+    else:
+        with output_path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(all_columns)
+            # Materialize each row positionally (missing columns become "");
+            # the generator keeps memory bounded and skips DictWriter's
+            # per-row field-name mapping
+            writer.writerows(
+                [sku_data[sku].get(col, "") for col in all_columns] for sku in sorted_skus
+            )
+
     print(f"Done! Wrote {len(sku_data)} rows")
     
     # Print column summary by group
     print("\nColumns by group:")
-    for group in group_order:
+    for group in GROUP_ORDER:
         group_cols = [c for c in sorted_spec_cols if c.startswith(f"{group}:")]
         if group_cols:
             print(f"  {group}: {len(group_cols)} columns")
 
 
+def convert_long_to_wide_streaming(input_path: Path, output_path: Path) -> None:
+    """Convert long to wide while holding only one SKU in memory at a time.
+
+    Relies on the scraper writing each SKU's rows consecutively in the long
+    CSV. Rows are emitted in first-seen SKU order (not sorted by SKU), and
+    peak memory drops from O(SKUs x columns) to O(columns).
+    """
+    print(f"Reading {input_path} (pass 1: columns)...")
+
+    spec_columns: dict[str, None] = {}
+    n_skus = 0
+
+    with input_path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        idx = {name: header.index(name) for name in LONG_CSV_COLUMNS}
+        sku_i, group_i, name_i = idx["sku"], idx["spec_group"], idx["spec_name"]
+
+        last_sku = None
+        for row in reader:
+            spec_columns[f"{row[group_i]}: {row[name_i]}"] = None
+            if row[sku_i] != last_sku:
+                last_sku = row[sku_i]
+                n_skus += 1
+
+    print(f"Found {n_skus} SKUs (first pass)")
+    print(f"Found {len(spec_columns)} unique spec columns")
+
+    sorted_spec_cols = sorted(spec_columns.keys(), key=column_sort_key)
+    all_columns = META_COLS + sorted_spec_cols
+
+    print(f"Writing {output_path} (pass 2: rows)...")
+
+    rows_written = 0
+    with input_path.open("r", encoding="utf-8", newline="") as f, \
+            output_path.open("w", encoding="utf-8", newline="") as out:
+        reader = csv.reader(f)
+        next(reader)  # header, columns validated in pass 1
+        writer = csv.writer(out)
+        writer.writerow(all_columns)
+
+        for sku, rows in groupby(reader, key=itemgetter(idx["sku"])):
+            first = next(rows)
+            row_data = {
+                "sku": sku,
+                "product_name": first[idx["product_name"]],
+                "product_url": first[idx["product_url"]],
+                "category": first[idx["category"]],
+                "family": first[idx["family"]],
+                "scraped_at": first[idx["scraped_at"]],
+            }
+            for row in chain([first], rows):
+                col_name = f"{row[group_i]}: {row[name_i]}"
+                row_data[col_name] = row[idx["spec_value"]]
+            writer.writerow([row_data.get(col, "") for col in all_columns])
+            rows_written += 1
+
+    print(f"Done! Wrote {rows_written} rows")
+
+
 def main() -> None:
     configure_console_utf8()
-    
+
     parser = argparse.ArgumentParser(
         description="Convert Intel ARK specs from long format to wide format"
     )
@@ -128,7 +265,19 @@ def main() -> None:
         default="intel_specs_wide.csv",
         help="Output wide-format CSV file (default: intel_specs_wide.csv)"
     )
-    
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Stream one SKU at a time instead of buffering the whole input "
+             "(rows come out in first-seen SKU order)"
+    )
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help="Write Parquet instead of CSV (requires pyarrow; also triggered "
+             "by a .parquet output suffix)"
+    )
+
     args = parser.parse_args()
     
     input_path = Path(args.input)
@@ -138,7 +287,17 @@ def main() -> None:
         print(f"Error: Input file not found: {input_path}")
         sys.exit(1)
     
-    convert_long_to_wide(input_path, output_path)
+    parquet = args.parquet or output_path.suffix.lower() == ".parquet"
+    if parquet and output_path.suffix.lower() != ".parquet":
+        output_path = output_path.with_suffix(".parquet")
+
+    if args.low_memory:
+        if parquet:
+            print("Error: --parquet is not supported with --low-memory")
+            sys.exit(1)
+        convert_long_to_wide_streaming(input_path, output_path)
+    else:
+        convert_long_to_wide(input_path, output_path, parquet=parquet)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import random
 import re
 import sqlite3
 import sys
-import time
 from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -14,37 +14,52 @@ from pathlib import Path
 from typing import Iterable
 from urllib.parse import urljoin
 
-from playwright.sync_api import Browser, Page, Request, sync_playwright
+from playwright.async_api import Browser, Page, Request, async_playwright
 
+try:
+    import lxml.html as lxml_html
+except ImportError:  # lxml is optional; fall back to in-browser extraction
+    lxml_html = None
 
-def goto_with_retry(page: Page, url: str, *, attempts: int = 3, timeout_ms: int = 120000) -> None:
+
+async def goto_with_retry(page: Page, url: str, *, attempts: int = 3, timeout_ms: int = 120000) -> None:
     last_err: Exception | None = None
     for attempt in range(1, attempts + 1):
         try:
-            page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+            # "commit" returns as soon as the response starts; the explicit
+            # wait_for_selector calls after each goto are the real readiness
+            # gate, so there is no need to wait for the full HTML parse here
+            await page.goto(url, wait_until="commit", timeout=timeout_ms)
             return
         except Exception as e:
             last_err = e
             if attempt < attempts:
-                time.sleep(2.0 * attempt)
+                await asyncio.sleep(2.0 * attempt)
                 continue
             raise
 
 
-def wait_for_ark_ready(page: Page) -> None:
-    page.wait_for_selector(
+async def wait_for_ark_ready(page: Page) -> None:
+    await page.wait_for_selector(
         'div.product-categories[data-parent-panel-key="Processors"]',
         timeout=60000,
     )
 
 
-def wait_for_specs_ready(page: Page) -> None:
-    page.wait_for_selector("div.tab-pane#specifications section.upe-tech-spec", timeout=60000)
+async def wait_for_specs_ready(page: Page) -> None:
+    await page.wait_for_selector("div.tab-pane#specifications section.upe-tech-spec", timeout=60000)
 
 BASE_URL = "https://www.intel.com"
 ARK_PROCESSORS_URL = "https://www.intel.com/content/www/us/en/ark.html#@Processors"
 
-SKU_RE = re.compile(r"/products/sku/(\d+)/")
+# Validates a spec link's SKU segment and suffix in one pass
+SPEC_URL_RE = re.compile(r"/products/sku/(\d+)/.+/specifications\.html")
+
+# Spec pages are network-bound and independent, so they are fetched on a
+# small pool of browser contexts; results are gathered per batch and
+# written from the coordinating task.
+SCRAPE_CONCURRENCY = 4
+SCRAPE_BATCH_SIZE = 50
 
 
 @dataclass(frozen=True)
@@ -67,17 +82,44 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+# \s already covers \xa0 in unicode mode, but keep it explicit: NBSP is
+# the main offender in ARK markup
+_WS_RE = re.compile(r"[\s\xa0]+")
+
+
 def normalize_text(value: str) -> str:
-    return " ".join(value.replace("\xa0", " ").split()).strip()
+    # One C-level regex pass instead of replace + split + join, which
+    # allocated an intermediate string and a word list per call
+    return _WS_RE.sub(" ", value).strip()
 
 
 def to_abs_url(href: str) -> str:
     return urljoin(BASE_URL, href)
 
 
+# Per-connection write-throughput pragmas. journal_mode=WAL (set in
+# ensure_db) persists in the database file; these do not, so they are
+# applied to every connection. synchronous=NORMAL is safe with WAL: a
+# commit becomes a log append instead of a full flush, and at most the
+# last uncommitted batch is lost on a crash.
+DB_PRAGMAS = [
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",  # 64 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA busy_timeout=5000",
+]
+
+
+def tune_connection(conn: sqlite3.Connection) -> None:
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
+
+
 def ensure_db(db_path: Path) -> None:
     with closing(sqlite3.connect(db_path)) as conn:
         conn.execute("PRAGMA journal_mode=WAL")
+        tune_connection(conn)
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS discovered_skus (
@@ -108,48 +150,88 @@ def ensure_db(db_path: Path) -> None:
             )
             """
         )
+        # Normalized row store: per-SKU metadata lives in discovered_skus /
+        # scraped_skus, so only the spec triple is stored per row. The long
+        # CSV is materialized on demand with --export-csv.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS spec_rows (
+              sku TEXT NOT NULL,
+              spec_group TEXT NOT NULL,
+              spec_name TEXT NOT NULL,
+              spec_value TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_spec_rows_sku ON spec_rows(sku)")
         conn.commit()
 
 
-def load_done_skus(conn: sqlite3.Connection) -> set[str]:
-    rows = conn.execute("SELECT sku FROM scraped_skus WHERE status = 'ok'").fetchall()
-    return {row[0] for row in rows}
-
-
-def load_failed_skus(conn: sqlite3.Connection) -> set[str]:
-    rows = conn.execute("SELECT sku FROM scraped_skus WHERE status = 'error'").fetchall()
-    return {row[0] for row in rows}
+# Hot-path SQL as module constants: sqlite3's statement cache is keyed on
+# the exact string object/text, so reusing one constant per statement
+# guarantees cache hits instead of re-parsing per call.
+COUNT_DONE_SKUS_SQL = "SELECT COUNT(*) FROM scraped_skus WHERE status = 'ok'"
+# Pending = never scraped, plus previously-errored when retry_errors is
+# set; the set difference runs on the scraped_skus PK index instead of
+# materializing done/failed sets in Python. LIMIT -1 means no limit.
+PENDING_SKUS_SQL = """
+SELECT d.sku, d.category, d.family, d.spec_url, d.product_name
+FROM discovered_skus d
+LEFT JOIN scraped_skus s ON s.sku = d.sku
+WHERE s.sku IS NULL OR (? AND s.status = 'error')
+ORDER BY d.sku
+LIMIT ?
+"""
+STORE_SERIES_SQL = "INSERT OR IGNORE INTO discovered_series(url, category, family) VALUES(?, ?, ?)"
+STORE_SKUS_SQL = """
+INSERT OR IGNORE INTO discovered_skus(sku, category, family, spec_url, product_name)
+VALUES(?, ?, ?, ?, ?)
+"""
+DELETE_SPEC_ROWS_SQL = "DELETE FROM spec_rows WHERE sku = ?"
+INSERT_SPEC_ROW_SQL = "INSERT INTO spec_rows(sku, spec_group, spec_name, spec_value) VALUES(?, ?, ?, ?)"
+UPDATE_PRODUCT_NAME_SQL = "UPDATE discovered_skus SET product_name = ? WHERE sku = ?"
+MARK_SKU_SQL = """
+INSERT OR REPLACE INTO scraped_skus(sku, scraped_at, status, last_error)
+VALUES(?, ?, ?, ?)
+"""
+
+
+def load_pending_skus(conn: sqlite3.Connection, retry_errors: bool, max_skus: int) -> list[sqlite3.Row]:
+    limit = max_skus if max_skus and max_skus > 0 else -1
+    cursor = conn.execute(PENDING_SKUS_SQL, (1 if retry_errors else 0, limit))
+    # Drain in fixed-size chunks rather than one fetchall: on a large
+    # backlog this bounds the per-step allocation the same way export_csv
+    # streams its result set
+    cursor.arraysize = 10000
+    pending: list[sqlite3.Row] = []
+    while batch := cursor.fetchmany():
+        pending.extend(batch)
+    return pending
 
 
 def store_series(conn: sqlite3.Connection, series: Iterable[SeriesLink]) -> None:
-    conn.executemany(
-        "INSERT OR IGNORE INTO discovered_series(url, category, family) VALUES(?, ?, ?)",
-        [(s.url, s.category, s.family) for s in series],
-    )
-    conn.commit()
+    conn.executemany(STORE_SERIES_SQL, [(s.url, s.category, s.family) for s in series])
 
 
 def store_skus(conn: sqlite3.Connection, skus: Iterable[SkuLink]) -> None:
     # A SKU can appear in multiple families/categories; we keep the first seen mapping.
     conn.executemany(
-        """
-        INSERT OR IGNORE INTO discovered_skus(sku, category, family, spec_url, product_name)
-        VALUES(?, ?, ?, ?, ?)
-        """,
+        STORE_SKUS_SQL,
         [(s.sku, s.category, s.family, s.spec_url, s.product_name) for s in skus],
     )
-    conn.commit()
 
 
-def mark_sku(conn: sqlite3.Connection, sku: str, status: str, error: str | None = None) -> None:
-    conn.execute(
-        """
-        INSERT OR REPLACE INTO scraped_skus(sku, scraped_at, status, last_error)
-        VALUES(?, ?, ?, ?)
-        """,
-        (sku, utc_now_iso(), status, error),
+def store_spec_rows(conn: sqlite3.Connection, sku: str, spec_rows: Iterable[tuple[str, str, str]]) -> None:
+    # Replace any rows from an earlier (failed or retried) scrape of this SKU
+    conn.execute(DELETE_SPEC_ROWS_SQL, (sku,))
+    conn.executemany(
+        INSERT_SPEC_ROW_SQL,
+        [(sku, group, name, value) for group, name, value in spec_rows],
     )
-    conn.commit()
+
+
+def mark_sku(conn: sqlite3.Connection, sku: str, status: str, error: str | None = None) -> None:
+    conn.execute(MARK_SKU_SQL, (sku, utc_now_iso(), status, error))
 
 
 def configure_console_utf8() -> None:
@@ -159,15 +241,39 @@ def configure_console_utf8() -> None:
         pass
 
 
+# Text extraction needs neither rendering nor trackers: sockets and heavy
+# assets are dropped wholesale, and known analytics/tag-manager hosts are
+# matched with one precompiled regex on the URL. Stylesheets are only
+# dropped on spec pages — ARK landing-page discovery keys on :visible
+# panel state, which is CSS-driven, so blocking CSS there would make
+# every category panel read as visible.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "websocket"})
+
+_BLOCKED_HOST_RE = re.compile(
+    r"google-analytics|doubleclick|adobedtm|demdex|omtrdc|scorecardresearch|tiqcdn"
+)
+
+
 def should_block_request(request: Request) -> bool:
-    rt = request.resource_type
-    if rt in {"image", "media", "font"}:
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
         return True
-    return False
+    if request.resource_type == "stylesheet" and SPEC_URL_RE.search(request.frame.url):
+        return True
+    return _BLOCKED_HOST_RE.search(request.url) is not None
+
+
+# Single module-level handler shared by every pooled page: routing fires
+# once per network request, so avoid rebuilding a closure per page and
+# keep the decision path to one frozenset probe plus one regex search.
+async def route_handler(route, request) -> None:
+    if should_block_request(request):
+        await route.abort()
+    else:
+        await route.continue_()
 
 
-def new_page(browser: Browser, storage_state: Path | None, headless: bool) -> Page:
-    context = browser.new_context(
+async def new_page(browser: Browser, storage_state: Path | None, headless: bool) -> Page:
+    context = await browser.new_context(
         locale="en-US",
         timezone_id="America/Los_Angeles",
         user_agent=(
@@ -177,85 +283,120 @@ def new_page(browser: Browser, storage_state: Path | None, headless: bool) -> Pa
         ),
         storage_state=str(storage_state) if storage_state and storage_state.exists() else None,
     )
-    page = context.new_page()
-    page.route("**/*", lambda route, req: route.abort() if should_block_request(req) else route.continue_())
+    page = await context.new_page()
+    await page.route("**/*", route_handler)
+    # Registering a route disables the HTTP cache, so every navigation
+    # would refetch the shared JS/XHR assets; turn the cache back on via
+    # CDP since spec pages all reuse the same hosted bundles.
+    cdp = await page.context.new_cdp_session(page)
+    await cdp.send("Network.setCacheDisabled", {"cacheDisabled": False})
     if not headless:
-        page.set_viewport_size({"width": 1280, "height": 720})
+        await page.set_viewport_size({"width": 1280, "height": 720})
     return page
 
 
-def polite_sleep(min_s: float = 0.6, max_s: float = 1.6) -> None:
-    time.sleep(random.uniform(min_s, max_s))
+async def polite_sleep(min_s: float = 0.6, max_s: float = 1.6) -> None:
+    await asyncio.sleep(random.uniform(min_s, max_s))
 
 
-def discover_processor_categories(page: Page) -> list[str]:
-    goto_with_retry(page, ARK_PROCESSORS_URL)
-    wait_for_ark_ready(page)
-
-    category_names = page.eval_on_selector_all(
-        'div.product-categories[data-parent-panel-key="Processors"] div.product-category span.name',
-        "els => els.map(e => e.textContent)",
-    )
-    return [normalize_text(n) for n in category_names if n]
-
+async def discover_all_series(page: Page) -> list[SeriesLink]:
+    """Discover every category's series links from a single ARK navigation.
 
-def discover_series_for_category(page: Page, category_name: str) -> list[SeriesLink]:
-    goto_with_retry(page, ARK_PROCESSORS_URL)
-    wait_for_ark_ready(page)
+    Clicking a category tile only toggles panel visibility in the DOM, so
+    one page load covers all categories instead of reloading the ARK page
+    per category.
+    """
+    await goto_with_retry(page, ARK_PROCESSORS_URL)
+    await wait_for_ark_ready(page)
 
-    # Click category tile inside the Processors panel (avoid header/nav duplicates).
-    tile = page.locator(
-        "div.product-categories[data-parent-panel-key=\"Processors\"] span.name:has-text(\""
-        + category_name
-        + "\")"
-    ).first
-    tile.click()
-
-    # After click, Intel toggles visibility on a matching "div.products.processors" panel.
-    page.wait_for_timeout(800)
-
-    selector = "div.products.processors:visible a.ark-accessible-color"
-    links = page.eval_on_selector_all(
-        selector,
-        "els => els.map(e => ({href: e.getAttribute('href'), text: e.textContent}))",
+    tiles = await page.eval_on_selector_all(
+        'div.product-categories[data-parent-panel-key="Processors"] div.product-category',
+        """
+        els => els.map(e => ({
+          name: e.querySelector('span.name')?.textContent ?? '',
+          panelKey: e.getAttribute('data-panel-key'),
+        }))
+        """,
     )
+    categories = [
+        (normalize_text(t["name"]), t.get("panelKey"))
+        for t in tiles
+        if normalize_text(t.get("name") or "")
+    ]
+    print(f"Found {len(categories)} categories")
 
     series: list[SeriesLink] = []
-    for item in links:
-        href = item.get("href")
-        text = normalize_text(item.get("text") or "")
-        if not href or not text:
-            continue
-        if "/ark/products/series/" not in href:
-            continue
-        series.append(SeriesLink(category=category_name, family=text, url=to_abs_url(href)))
+    for category_name, panel_key in categories:
+        print(f"Discovering series for category: {category_name}")
+
+        # Click category tile inside the Processors panel (avoid header/nav duplicates).
+        tile = page.locator(
+            "div.product-categories[data-parent-panel-key=\"Processors\"] span.name:has-text(\""
+            + category_name
+            + "\")"
+        ).first
+        await tile.click()
+
+        # Scope the readiness wait and the scrape to the clicked tile's
+        # own panel: with all categories walked on one page load, the
+        # previous category's still-visible panel would otherwise satisfy
+        # a bare :visible wait immediately and get read instead
+        if panel_key:
+            panel_selector = f'div.products.processors[data-parent-panel-key="{panel_key}"]'
+        else:
+            panel_selector = "div.products.processors:visible"
+
+        # After click, Intel toggles visibility on the matching panel;
+        # wait on that condition instead of a fixed 800 ms sleep
+        # (wait_for_selector's default state is "visible")
+        await page.wait_for_selector(f"{panel_selector} a.ark-accessible-color", timeout=5000)
+
+        # Filter to series links browser-side so a single round-trip returns
+        # only the entries we keep
+        links = await page.eval_on_selector_all(
+            f"{panel_selector} a.ark-accessible-color",
+            """
+            els => els
+              .map(e => ({href: e.getAttribute('href'), text: e.textContent}))
+              .filter(l => l.href && l.href.includes('/ark/products/series/'))
+            """,
+        )
+
+        for item in links:
+            text = normalize_text(item.get("text") or "")
+            if not text:
+                continue
+            series.append(SeriesLink(category=category_name, family=text, url=to_abs_url(item["href"])))
+
     return series
 
 
-def extract_skus_from_series_page(page: Page, category: str, family: str, series_url: str) -> list[SkuLink]:
-    goto_with_retry(page, series_url)
-    page.wait_for_selector("table#product-table", timeout=60000)
+async def extract_skus_from_series_page(page: Page, category: str, family: str, series_url: str) -> list[SkuLink]:
+    await goto_with_retry(page, series_url)
+    await page.wait_for_selector("table#product-table", timeout=60000)
 
-    # Product rows contain data-product-id=<sku> and a link to /products/sku/<sku>/.../specifications.html
-    items = page.eval_on_selector_all(
+    # Product rows contain data-product-id=<sku> and a link to /products/sku/<sku>/.../specifications.html;
+    # rows without a usable spec link are dropped browser-side
+    items = await page.eval_on_selector_all(
         "table#product-table tr[data-product-id]",
         """
-        rows => rows.map(r => {
-          const sku = r.getAttribute('data-product-id');
-          const a = r.querySelector('td.ark-product-name a[href*="/products/sku/"]');
-          return { sku, name: a ? a.textContent : null, href: a ? a.getAttribute('href') : null };
-        })
+        rows => rows
+          .map(r => {
+            const sku = r.getAttribute('data-product-id');
+            const a = r.querySelector('td.ark-product-name a[href*="/products/sku/"]');
+            return { sku, name: a ? a.textContent : null, href: a ? a.getAttribute('href') : null };
+          })
+          .filter(i => i.sku && i.href && i.href.includes('specifications.html'))
         """,
     )
 
     results: list[SkuLink] = []
     for item in items:
-        sku = (item.get("sku") or "").strip()
+        sku = item["sku"].strip()
         name = normalize_text(item.get("name") or "")
-        href = item.get("href")
-        if not sku or not href:
-            continue
-        if "specifications.html" not in href:
+        # One regex pass validates both the SKU segment and the
+        # specifications.html suffix of the href
+        if not sku or SPEC_URL_RE.search(item["href"]) is None:
             continue
         results.append(
             SkuLink(
@@ -263,104 +404,183 @@ def extract_skus_from_series_page(page: Page, category: str, family: str, series
                 product_name=name,
                 category=category,
                 family=family,
-                spec_url=to_abs_url(href),
+                spec_url=to_abs_url(item["href"]),
             )
         )
 
     return results
 
 
-def scrape_spec_rows(page: Page, spec_url: str) -> tuple[str, list[tuple[str, str, str]]]:
-    goto_with_retry(page, spec_url)
-    wait_for_specs_ready(page)
-
-    title = page.locator("section.upe-tech-spec").get_attribute("data-title-start")
-    product_name = normalize_text(title or page.title() or "")
+def parse_spec_html(html: str) -> tuple[str, list[tuple[str, str, str]]]:
+    """Extract the product title and spec rows from a rendered spec page."""
+    tree = lxml_html.fromstring(html)
 
-    section_ids = page.eval_on_selector_all(
-        "div.tech-section[id^='specs-']",
-        "els => els.map(e => e.id)",
-    )
+    titles = tree.xpath("//section[contains(@class, 'upe-tech-spec')]/@data-title-start")
+    title = titles[0] if titles else (tree.findtext(".//title") or "")
 
     rows: list[tuple[str, str, str]] = []
-    for section_id in section_ids:
-        section_selector = f"div.tech-section#{section_id}"
-        group_name = normalize_text(
-            page.locator(f"{section_selector} h3").first.text_content() or ""
-        )
+    for section in tree.xpath("//div[contains(@class, 'tech-section')][starts-with(@id, 'specs-')]"):
+        group_name = normalize_text("".join(section.xpath(".//h3[1]//text()")))
         if not group_name:
             continue
+        for row in section.xpath(".//div[contains(@class, 'tech-section-row')]"):
+            label = normalize_text("".join(row.xpath(".//*[contains(@class, 'tech-label')]//span//text()")))
+            value = normalize_text("".join(row.xpath(".//*[contains(@class, 'tech-data')]//text()")))
+            if label and value:
+                rows.append((group_name, label, value))
+
+    return normalize_text(title), rows
+
+
+async def scrape_spec_rows(page: Page, spec_url: str) -> tuple[str, list[tuple[str, str, str]]]:
+    await goto_with_retry(page, spec_url)
+    await wait_for_specs_ready(page)
+
+    if lxml_html is not None:
+        # Spec pages are server-rendered, so grab the HTML once and parse
+        # it with lxml in a worker thread: the C-level XPath walk skips JS
+        # evaluation entirely and runs off the event loop, concurrently
+        # with other pages' navigations
+        html = await page.content()
+        return await asyncio.to_thread(parse_spec_html, html)
+
+    # One evaluate for the whole page: the per-section walk is DOM-local
+    # work, so doing it browser-side costs a single IPC round-trip instead
+    # of 2+N (title, section ids, then one call per section).
+    extracted = await page.evaluate(
+        """
+        () => {
+          const out = [];
+          document.querySelectorAll("div.tech-section[id^='specs-']").forEach(sec => {
+            const group = sec.querySelector('h3')?.textContent ?? '';
+            sec.querySelectorAll('div.row.tech-section-row').forEach(row => {
+              out.push({
+                group,
+                label: row.querySelector('.tech-label span')?.textContent ?? '',
+                value: row.querySelector('.tech-data')?.innerText ?? '',
+              });
+            });
+          });
+          return {
+            title: document.querySelector('section.upe-tech-spec')?.getAttribute('data-title-start')
+                   || document.title,
+            rows: out,
+          };
+        }
+        """
+    )
 
-        pairs = page.eval_on_selector_all(
-            f"{section_selector} div.row.tech-section-row",
-            """
-            els => els.map(row => {
-              const label = row.querySelector('.tech-label span')?.textContent ?? '';
-              const dataNode = row.querySelector('.tech-data');
-              const value = dataNode?.innerText ?? '';
-              return { label, value };
-            })
-            """,
-        )
+    product_name = normalize_text(extracted.get("title") or "")
 
-        for p in pairs:
-            label = normalize_text(p.get("label") or "")
-            value = normalize_text(p.get("value") or "")
-            if not label or not value:
-                continue
-            rows.append((group_name, label, value))
+    rows: list[tuple[str, str, str]] = []
+    for item in extracted["rows"]:
+        group_name = normalize_text(item.get("group") or "")
+        label = normalize_text(item.get("label") or "")
+        value = normalize_text(item.get("value") or "")
+        if not group_name or not label or not value:
+            continue
+        rows.append((group_name, label, value))
 
     return product_name, rows
 
 
-def write_csv_rows(
-    csv_path: Path,
-    sku: str,
-    product_name: str,
-    product_url: str,
-    category: str,
-    family: str,
-    spec_rows: Iterable[tuple[str, str, str]],
-) -> int:
-    is_new = not csv_path.exists()
+CSV_HEADER = [
+    "sku",
+    "product_name",
+    "product_url",
+    "category",
+    "family",
+    "spec_group",
+    "spec_name",
+    "spec_value",
+    "scraped_at",
+]
+
+
+# One query rebuilds the denormalized long CSV; rowid order keeps each
+# SKU's rows consecutive and in scrape order for downstream streaming.
+EXPORT_CSV_SQL = """
+SELECT d.sku, d.product_name, d.spec_url, d.category, d.family,
+       r.spec_group, r.spec_name, r.spec_value, s.scraped_at
+FROM spec_rows r
+JOIN discovered_skus d ON d.sku = r.sku
+JOIN scraped_skus s ON s.sku = r.sku
+ORDER BY d.sku, r.rowid
+"""
+
+
+def export_csv(conn: sqlite3.Connection, csv_path: Path) -> None:
+    """Materialize the long-format CSV from the spec_rows table."""
     csv_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with csv_path.open("a", newline="", encoding="utf-8") as f:
+    cursor = conn.execute(EXPORT_CSV_SQL)
+    rows_written = 0
+    with csv_path.open("w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
-        if is_new:
-            writer.writerow(
-                [
-                    "sku",
-                    "product_name",
-                    "product_url",
-                    "category",
-                    "family",
-                    "spec_group",
-                    "spec_name",
-                    "spec_value",
-                    "scraped_at",
-                ]
-            )
-
-        count = 0
-        scraped_at = utc_now_iso()
-        for group, spec_name, spec_value in spec_rows:
-            writer.writerow(
-                [
-                    sku,
-                    product_name,
-                    product_url,
-                    category,
-                    family,
-                    group,
-                    spec_name,
-                    spec_value,
-                    scraped_at,
-                ]
-            )
-            count += 1
-
-    return count
+        writer.writerow(CSV_HEADER)
+        while batch := cursor.fetchmany(10000):
+            writer.writerows(batch)
+            rows_written += len(batch)
+    print(f"Exported {rows_written} rows to {csv_path}")
+
+
+def record_scrape_result(
+    conn: sqlite3.Connection,
+    row: sqlite3.Row,
+    product_name: str | None,
+    packed_rows: list[tuple[str, str, str]] | None,
+    error: str | None,
+) -> str:
+    """Record one SKU's outcome — spec rows, name and status share the
+    enclosing batched transaction, so the whole result commits (or rolls
+    back) atomically with a single fsync per batch."""
+    sku = row["sku"]
+    if error is None:
+        store_spec_rows(conn, sku, packed_rows)
+        conn.execute(UPDATE_PRODUCT_NAME_SQL, (product_name or (row["product_name"] or ""), sku))
+        mark_sku(conn, sku, status="ok", error=None)
+        return f"OK sku={sku} rows={len(packed_rows)}"
+    mark_sku(conn, sku, status="error", error=error)
+    return f"ERROR sku={sku}: {error}"
+
+
+async def extract_one_series(
+    page_pool: asyncio.Queue,
+    semaphore: asyncio.Semaphore,
+    series: SeriesLink,
+) -> list[SkuLink]:
+    """Extract one series' SKU table on a pooled page (jitter retained).
+
+    Failures are contained per series: raising out of the gather would
+    roll back the whole discovery transaction and crash the run.
+    """
+    async with semaphore:
+        page = await page_pool.get()
+        try:
+            await polite_sleep(0.2, 0.8)
+            return await extract_skus_from_series_page(page, series.category, series.family, series.url)
+        except Exception as e:
+            print(f"ERROR series {series.family}: {e}")
+            return []
+        finally:
+            page_pool.put_nowait(page)
+
+
+async def scrape_one(
+    page_pool: asyncio.Queue,
+    semaphore: asyncio.Semaphore,
+    row: sqlite3.Row,
+) -> tuple[sqlite3.Row, str | None, list[tuple[str, str, str]] | None, str | None]:
+    """Fetch one SKU's spec page on a pooled page; returns (row, name, rows, error)."""
+    async with semaphore:
+        page = await page_pool.get()
+        try:
+            await polite_sleep(0.2, 0.8)
+            product_name, packed_rows = await scrape_spec_rows(page, row["spec_url"])
+            return row, product_name, packed_rows, None
+        except Exception as e:
+            return row, None, None, str(e)
+        finally:
+            page_pool.put_nowait(page)
 
 
 def parse_args() -> argparse.Namespace:
@@ -384,13 +604,15 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Retry SKUs previously marked as error",
     )
+    p.add_argument(
+        "--export-csv",
+        action="store_true",
+        help="Skip scraping and export the long CSV from the state DB",
+    )
     return p.parse_args()
 
 
-def main() -> None:
-    configure_console_utf8()
-    args = parse_args()
-
+async def async_main(args: argparse.Namespace) -> None:
     out_csv = Path(args.out)
     db_path = Path(args.db)
     storage_state = Path(args.storage_state)
@@ -399,97 +621,96 @@ def main() -> None:
 
     with closing(sqlite3.connect(db_path)) as conn:
         conn.row_factory = sqlite3.Row
-        done_skus = load_done_skus(conn)
-        failed_skus = load_failed_skus(conn)
+        tune_connection(conn)
+
+        if args.export_csv:
+            export_csv(conn, out_csv)
+            return
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=not args.headful)
-            page = new_page(browser, storage_state, headless=not args.headful)
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=not args.headful)
+            pages = [
+                await new_page(browser, storage_state, headless=not args.headful)
+                for _ in range(SCRAPE_CONCURRENCY)
+            ]
+            page = pages[0]  # series discovery runs sequentially on the first page
+
+            page_pool: asyncio.Queue = asyncio.Queue()
+            for pg in pages:
+                page_pool.put_nowait(pg)
+            semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
 
             try:
                 if not args.skip_discovery:
                     print("Discovering processor categories...")
-                    categories = discover_processor_categories(page)
-
-                    print(f"Found {len(categories)} categories")
-                    all_series: list[SeriesLink] = []
-                    for cat in categories:
-                        print(f"Discovering series for category: {cat}")
-                        series = discover_series_for_category(page, cat)
-                        store_series(conn, series)
-                        all_series.extend(series)
-                        polite_sleep()
-
-                    print(f"Discovered {len(all_series)} series")
-
-                    total_skus = 0
-                    for series in all_series:
-                        print(f"Extracting SKUs from series: {series.family}")
-                        skus = extract_skus_from_series_page(page, series.category, series.family, series.url)
-                        store_skus(conn, skus)
-                        total_skus += len(skus)
-                        polite_sleep()
+                    # One transaction for the whole discovery phase: the
+                    # store_* helpers no longer commit (and fsync) per call.
+                    with conn:
+                        all_series = await discover_all_series(page)
+                        store_series(conn, all_series)
+
+                        print(f"Discovered {len(all_series)} series")
+
+                        # Series pages are independent: fan extraction out
+                        # over the page pool, storing results from this task
+                        total_skus = 0
+                        for start in range(0, len(all_series), SCRAPE_CONCURRENCY):
+                            batch = all_series[start:start + SCRAPE_CONCURRENCY]
+                            for series in batch:
+                                print(f"Extracting SKUs from series: {series.family}")
+                            for skus in await asyncio.gather(
+                                *(extract_one_series(page_pool, semaphore, s) for s in batch)
+                            ):
+                                store_skus(conn, skus)
+                                total_skus += len(skus)
 
                     print(f"Discovered {total_skus} SKU entries (dedup happens in DB)")
 
                 # Scrape loop
-                rows = conn.execute(
-                    """
-                    SELECT sku, category, family, spec_url, product_name
-                    FROM discovered_skus
-                    ORDER BY sku
-                    """
-                ).fetchall()
-
-                if args.retry_errors:
-                    pending = [r for r in rows if r["sku"] not in done_skus]
-                else:
-                    pending = [r for r in rows if r["sku"] not in done_skus and r["sku"] not in failed_skus]
-                if args.max_skus and args.max_skus > 0:
-                    pending = pending[: args.max_skus]
-
-                print(f"Scraping {len(pending)} SKUs (already done: {len(done_skus)})")
-
-                for idx, r in enumerate(pending, start=1):
-                    sku = r["sku"]
-                    category = r["category"]
-                    family = r["family"]
-                    spec_url = r["spec_url"]
-                    fallback_name = r["product_name"] or ""
+                pending = load_pending_skus(conn, args.retry_errors, args.max_skus)
+                done_count = conn.execute(COUNT_DONE_SKUS_SQL).fetchone()[0]
 
-                    try:
-                        polite_sleep(0.2, 0.8)
-                        product_name, packed_rows = scrape_spec_rows(page, spec_url)
-                        product_name = product_name or fallback_name
-
-                        written = write_csv_rows(
-                            out_csv,
-                            sku=sku,
-                            product_name=product_name,
-                            product_url=spec_url,
-                            category=category,
-                            family=family,
-                            spec_rows=packed_rows,
-                        )
-                        mark_sku(conn, sku, status="ok", error=None)
-                        print(f"[{idx}/{len(pending)}] OK sku={sku} rows={written}")
-
-                        # Save cookies periodically
-                        if idx % 25 == 0:
-                            page.context.storage_state(path=str(storage_state))
-
-                    except Exception as e:
-                        mark_sku(conn, sku, status="error", error=str(e))
-                        print(f"[{idx}/{len(pending)}] ERROR sku={sku}: {e}")
-
-                page.context.storage_state(path=str(storage_state))
+                print(f"Scraping {len(pending)} SKUs (already done: {done_count})")
+
+                total = len(pending)
+                idx = 0
+                for start in range(0, total, SCRAPE_BATCH_SIZE):
+                    batch = pending[start:start + SCRAPE_BATCH_SIZE]
+                    results = await asyncio.gather(
+                        *(scrape_one(page_pool, semaphore, r) for r in batch)
+                    )
+
+                    # SQLite writes stay in this single task, so the fetch
+                    # workers never contend on the connection
+                    for r, product_name, packed_rows, error in results:
+                        idx += 1
+                        outcome = record_scrape_result(conn, r, product_name, packed_rows, error)
+                        print(f"[{idx}/{total}] {outcome}")
+
+                    # Flush rows, state and cookies per batch; batching
+                    # commits avoids one fsync per SKU
+                    conn.commit()
+                    await page.context.storage_state(path=str(storage_state))
+
+                conn.commit()
+                await page.context.storage_state(path=str(storage_state))
+
+                if pending:
+                    export_csv(conn, out_csv)
 
             finally:
-                try:
-                    page.context.close()
-                except Exception:
-                    pass
-                browser.close()
+                for pg in pages:
+                    try:
+                        await pg.context.close()
+                    except Exception:
+                        pass
+                await browser.close()
+
+
+def main() -> None:
+    configure_console_utf8()
+    args = parse_args()
+    asyncio.run(async_main(args))
 
 
 if __name__ == "__main__":